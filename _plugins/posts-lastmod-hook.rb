@@ -4,14 +4,15 @@
 
 Jekyll::Hooks.register :posts, :post_init do |post|
 
+  # Only set last_modified_at if it's not already specified in frontmatter,
+  # so posts that pin it don't pay for the git subprocesses
+  next if post.data['last_modified_at']
+
   commit_num = `git rev-list --count HEAD "#{ post.path }"`
 
   if commit_num.to_i > 1
-    # Only set last_modified_at if it's not already specified in frontmatter
-    unless post.data['last_modified_at']
-      lastmod_date = `git log -1 --pretty="%ad" --date=iso "#{ post.path }"`
-      post.data['last_modified_at'] = lastmod_date
-    end
+    lastmod_date = `git log -1 --pretty="%ad" --date=iso "#{ post.path }"`
+    post.data['last_modified_at'] = lastmod_date
   end
 
 end